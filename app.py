@@ -1,15 +1,31 @@
 import os
+
+from worker_mode import USE_GEVENT
+
+# Make blocking socket I/O cooperative when running under gevent. This has to
+# happen before requests, urllib3, asyncio and friends are imported.
+if USE_GEVENT:
+    from gevent import monkey
+    monkey.patch_all()
+
 import csv
-import io
 import re
 import json
 import base64
+import hashlib
 import asyncio
+import threading
+import time
+import unicodedata
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, is_dataclass, replace
+from operator import attrgetter
 from flask import Flask, render_template, request, Response, jsonify
-from serpapi import GoogleSearch
+from flask.json.provider import DefaultJSONProvider
 import requests
-from bs4 import BeautifulSoup
-from openai import OpenAI
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from cachetools import TTLCache
 from urllib.parse import urlparse
 
 # Import ranking extractor
@@ -20,6 +36,50 @@ except ImportError:
     EXTRACTOR_AVAILABLE = False
     print("Warning: Ranking extractor not available")
 
+# lxml for fast page parsing (falls back to BeautifulSoup's html.parser)
+try:
+    import lxml.html
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    from bs4 import BeautifulSoup
+    LXML_AVAILABLE = False
+
+# Aho-Corasick automaton for brand matching (falls back to regex)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Faster JSON encoding for API responses (falls back to stdlib json)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Brotli decoding for compressed page fetches (urllib3 decodes "br" when installed)
+try:
+    import brotli  # noqa: F401
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+# diskcache for a persistent answer cache shared by workers on one host (optional)
+try:
+    import diskcache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+
+# Redis for caches shared between gunicorn workers (optional)
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
 # Google Sheets imports
 try:
     import gspread
@@ -28,13 +88,40 @@ try:
 except ImportError:
     GSPREAD_AVAILABLE = False
 
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider that encodes with orjson instead of stdlib json."""
+
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_NON_STR_KEYS
+        # Keep Flask's key order: sorted unless sort_keys is turned off.
+        # OPT_SORT_KEYS doesn't apply to dataclasses (e.g. PAAItem), so those
+        # go through _default as dicts when sorting.
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS
+        return orjson.dumps(obj, default=self._default, option=option).decode()
+
+    def _default(self, obj):
+        if is_dataclass(obj):
+            return asdict(obj)
+        return self.default(obj)
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+if ORJSON_AVAILABLE:
+    app.json = OrjsonProvider(app)
 
 # Get API keys from environment variables
 SERPAPI_KEY = os.environ.get("SERPAPI_KEY", "")
 OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY", "")
 ANTHROPIC_API_KEY = os.environ.get("ANTHROPIC_API_KEY", "")
 
+# Redis configuration (shared cache between workers)
+REDIS_URL = os.environ.get("REDIS_URL", "")
+
 # Google Sheets configuration
 GOOGLE_SHEETS_CREDENTIALS = os.environ.get("GOOGLE_SHEETS_CREDENTIALS", "")
 GOOGLE_SPREADSHEET_ID = os.environ.get("GOOGLE_SPREADSHEET_ID", "")
@@ -58,10 +145,95 @@ WP_SITES = {
     }
 }
 
+
+def _basic_auth_header(user, password):
+    """HTTP Basic Authorization header value for a WordPress application password."""
+    return "Basic " + base64.b64encode(f"{user}:{password}".encode()).decode()
+
+
+# Basic auth header per site, encoded once instead of on every WordPress call
+WP_SITES = {
+    domain: {**site, "auth_header": _basic_auth_header(site["user"], site["password"])}
+    if site["user"] and site["password"] else site
+    for domain, site in WP_SITES.items()
+}
+
+# Background event loop shared by the async clients (OpenAI, ranking extractor),
+# so their connection pools survive between requests.
+#
+# Under gevent the patched threading makes this "thread" a greenlet. That
+# works because the loop's selector and self-pipe are patched too, so it
+# yields to the hub while idle, and run_async only waits on a patched
+# Condition. Nothing may call asyncio.run() in a request, though: all
+# greenlets share one OS thread, which already has this loop running.
+async_loop = asyncio.new_event_loop()
+threading.Thread(target=async_loop.run_forever, name="async-loop", daemon=True).start()
+
 # Initialize OpenAI client
+OPENAI_CONCURRENCY = int(os.environ.get("OPENAI_CONCURRENCY", 10))
+ANSWER_BATCH_SIZE = int(os.environ.get("ANSWER_BATCH_SIZE", 10))
+ANSWER_MODEL = "gpt-4o-mini"
+
+# Cache of generated answers, keyed by model, prompt version, question and page context
+ANSWER_CACHE_TTL = int(os.environ.get("ANSWER_CACHE_TTL", 86400))
+answer_cache = TTLCache(maxsize=10_000, ttl=ANSWER_CACHE_TTL)
+answer_cache_lock = threading.Lock()
+
+# Persistent second tier for the answer cache: survives restarts and is shared
+# by all workers on the host. Set ANSWER_CACHE_DIR="" to disable.
+ANSWER_CACHE_DIR = os.environ.get("ANSWER_CACHE_DIR", "/tmp/paa_answers")
+ANSWER_DISK_CACHE_TTL = int(os.environ.get("ANSWER_DISK_CACHE_TTL", 30 * 86400))
+answer_disk_cache = None
+if DISKCACHE_AVAILABLE and ANSWER_CACHE_DIR:
+    try:
+        answer_disk_cache = diskcache.Cache(ANSWER_CACHE_DIR)
+    except Exception as e:
+        print(f"Failed to open answer disk cache: {e}")
+
+# OpenAI Batch API jobs started from /api/scrape-batch (also kept in Redis when configured)
+BATCH_JOB_TTL = 2 * 86400
+batch_jobs = TTLCache(maxsize=1024, ttl=BATCH_JOB_TTL)
+batch_jobs_lock = threading.Lock()
+
+# OpenAI client, created on first use by get_openai_client()
 openai_client = None
-if OPENAI_API_KEY:
-    openai_client = OpenAI(api_key=OPENAI_API_KEY)
+openai_client_lock = threading.Lock()
+
+
+def get_openai_client():
+    """
+    Return the shared AsyncOpenAI client, or None without an API key.
+    The openai SDK is only imported when answers are first generated, so
+    workers that never do (or only answer health checks) start faster.
+    """
+    global openai_client
+    if openai_client is None and OPENAI_API_KEY:
+        with openai_client_lock:
+            if openai_client is None:
+                import httpx
+                from openai import AsyncOpenAI
+
+                # One pooled HTTP client for all OpenAI calls, sized to the number
+                # of concurrent requests so parallel batches reuse warm connections
+                openai_client = AsyncOpenAI(
+                    api_key=OPENAI_API_KEY,
+                    http_client=httpx.AsyncClient(
+                        limits=httpx.Limits(
+                            max_connections=OPENAI_CONCURRENCY,
+                            max_keepalive_connections=OPENAI_CONCURRENCY
+                        ),
+                        timeout=httpx.Timeout(60.0, connect=10.0)
+                    )
+                )
+    return openai_client
+
+# Initialize Redis client
+redis_client = None
+if REDIS_AVAILABLE and REDIS_URL:
+    try:
+        redis_client = redis.Redis.from_url(REDIS_URL, socket_timeout=2)
+    except Exception as e:
+        print(f"Failed to initialize Redis client: {e}")
 
 # Initialize Google Sheets client
 sheets_client = None
@@ -79,11 +251,215 @@ if GSPREAD_AVAILABLE and GOOGLE_SHEETS_CREDENTIALS:
         sheets_init_error = str(e)
         print(f"Failed to initialize Google Sheets client: {e}")
 
+# Spreadsheet and per-domain worksheet handles, resolved once instead of on
+# every save (each lookup is a round trip to Google). The spreadsheet is
+# opened at startup; if that fails, the first save retries it.
+spreadsheet_handle = None
+worksheet_cache = {}
+worksheet_cache_lock = threading.Lock()
+if sheets_client and GOOGLE_SPREADSHEET_ID:
+    try:
+        spreadsheet_handle = sheets_client.open_by_key(GOOGLE_SPREADSHEET_ID)
+    except Exception as e:
+        sheets_init_error = str(e)
+        print(f"Failed to open spreadsheet: {e}")
+
+# Small pool for running WordPress lookups side by side
+wp_executor = ThreadPoolExecutor(max_workers=8)
+
+# WordPress page URL -> {"id", "type"}, so repeat publishes to the same page
+# skip the slug search
+wp_lookup_cache = TTLCache(maxsize=1024, ttl=900)
+wp_lookup_cache_lock = threading.Lock()
+
+
+class SerpApiThrottle:
+    """
+    Client-side rate limiter for SerpAPI requests.
+
+    Combines a token bucket (requests per minute) with an AIMD concurrency
+    limit: a 429 response halves the allowed concurrency, every 2xx
+    response raises it by 0.5 again up to max_concurrency. Failed requests
+    and other statuses leave it unchanged.
+
+    Rate limit headers on responses are used to pause all requests: on a
+    429 for Retry-After seconds, and when fewer than 10% of the requests in
+    the current window remain, until the window resets.
+    """
+
+    def __init__(self, rate_per_minute, max_concurrency):
+        if rate_per_minute <= 0 or max_concurrency < 1:
+            raise ValueError("SerpAPI rate per minute and max concurrency must be positive")
+        self.rate = rate_per_minute / 60.0
+        self.capacity = float(max_concurrency)
+        self.tokens = self.capacity
+        self.max_concurrency = float(max_concurrency)
+        self.concurrency = float(max_concurrency)
+        self.in_flight = 0
+        self.paused_until = 0.0
+        self.last_refill = time.monotonic()
+        self.condition = threading.Condition()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+
+    def _pause(self, seconds):
+        self.paused_until = max(self.paused_until, time.monotonic() + min(seconds, 60))
+
+    def acquire(self):
+        """Block until a request may be sent."""
+        with self.condition:
+            while True:
+                self._refill()
+                paused_for = self.paused_until - time.monotonic()
+                if paused_for <= 0 and self.in_flight < int(self.concurrency) and self.tokens >= 1:
+                    self.tokens -= 1
+                    self.in_flight += 1
+                    return
+                # Wait for the pause to end, a slot to free up or the next token
+                self.condition.wait(timeout=max(paused_for, (1 - self.tokens) / self.rate, 0.05))
+
+    def release(self, status_code=None, headers=None):
+        """Mark a request as finished and adapt to the response it got."""
+        headers = headers or {}
+        with self.condition:
+            self.in_flight -= 1
+            if status_code == 429:
+                self.concurrency = max(1.0, self.concurrency * 0.5)
+                retry_after = headers.get("Retry-After", "1")
+                self._pause(int(retry_after) if retry_after.isdigit() else 1)
+            elif status_code is not None and 200 <= status_code < 300:
+                self.concurrency = min(self.max_concurrency, self.concurrency + 0.5)
+
+            remaining = headers.get("X-RateLimit-Remaining")
+            limit = headers.get("X-RateLimit-Limit")
+            reset = headers.get("X-RateLimit-Reset")
+            if remaining and limit and reset and remaining.isdigit() and limit.isdigit() and reset.isdigit():
+                if int(remaining) < 0.1 * int(limit):
+                    # Reset is either seconds until reset or an epoch timestamp
+                    reset_in = int(reset)
+                    if reset_in > 1_000_000_000:
+                        reset_in -= int(time.time())
+                    self._pause(max(reset_in, 0))
+
+            self.condition.notify_all()
+
+    def stats(self):
+        """Current limiter state, for the health endpoint."""
+        with self.condition:
+            return {
+                "concurrency": self.concurrency,
+                "in_flight": self.in_flight,
+                "paused_for": round(max(self.paused_until - time.monotonic(), 0), 1)
+            }
+
+
+SERPAPI_URL = "https://serpapi.com/search.json"
+
+# Shared HTTP session so outbound calls (SerpAPI, page fetches, WordPress)
+# reuse pooled keep-alive connections instead of a new TCP + TLS handshake
+# every time. Retries only cover idempotent methods, so WordPress updates
+# (POST) are never sent twice.
+http_session = requests.Session()
+http_session.headers["User-Agent"] = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36"
+http_adapter = HTTPAdapter(
+    pool_connections=20,
+    pool_maxsize=32,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504], raise_on_status=False)
+)
+http_session.mount("https://", http_adapter)
+http_session.mount("http://", http_adapter)
+
+# Keep SerpAPI traffic under the plan limits instead of running into 429s
+SERPAPI_RATE_PER_MINUTE = int(os.environ.get("SERPAPI_RATE_PER_MINUTE", 100))
+SERPAPI_MAX_CONCURRENCY = int(os.environ.get("SERPAPI_MAX_CONCURRENCY", 8))
+serpapi_throttle = SerpApiThrottle(SERPAPI_RATE_PER_MINUTE, SERPAPI_MAX_CONCURRENCY)
+
+# Shared worker pool for outbound SerpAPI requests, so request threads
+# don't have to spin up their own pool for every scrape
+serpapi_executor = ThreadPoolExecutor(max_workers=32)
+
+# Separate pool for whole-keyword scrapes in /api/scrape-many. Those submit
+# their expansions to serpapi_executor, so sharing it could deadlock.
+MAX_KEYWORDS_PER_REQUEST = int(os.environ.get("MAX_KEYWORDS_PER_REQUEST", 20))
+keyword_executor = ThreadPoolExecutor(max_workers=4)
+
+# Cache of raw SerpAPI responses, keyed by a hash of the request params
+SERPAPI_CACHE_TTL = int(os.environ.get("SERPAPI_CACHE_TTL", 900))
+serpapi_cache = TTLCache(maxsize=1024, ttl=SERPAPI_CACHE_TTL)
+serpapi_cache_lock = threading.Lock()
+
+# Cache of scraped PAA results so repeat keywords don't cost SerpAPI credits
+PAA_CACHE_TTL = int(os.environ.get("PAA_CACHE_TTL", 3600))
+paa_cache = TTLCache(maxsize=2048, ttl=PAA_CACHE_TTL)
+paa_cache_lock = threading.RLock()
+
+# Parsed page info for /url lookups, keyed by URL. Entries younger than
+# PAGE_INFO_FRESH_SECONDS are served as-is; older ones are revalidated with a
+# conditional GET using the stored ETag/Last-Modified until they expire.
+PAGE_INFO_FRESH_SECONDS = int(os.environ.get("PAGE_INFO_FRESH_SECONDS", 600))
+page_info_cache = TTLCache(maxsize=512, ttl=86400)
+page_info_cache_lock = threading.Lock()
+
+# Scrapes currently in progress, so concurrent requests for the same keyword
+# wait for the first one instead of hitting SerpAPI again
+paa_inflight = {}
+
 # Allowed domains for URL search
 ALLOWED_DOMAINS = ["finerbrew.com", "de-koffiekompas.nl", "de-baardman.nl"]
 
+# Brand names that make a question less relevant when not part of the keyword
+BRAND_NAMES = frozenset([
+    # Coffee machine brands
+    "jura", "delonghi", "de'longhi", "philips", "nespresso", "senseo",
+    "dolce gusto", "siemens", "bosch", "melitta", "krups", "saeco",
+    "moccamaster", "bialetti", "lavazza", "illy", "sage", "breville",
+    # Car brands
+    "bmw", "mercedes", "audi", "volkswagen", "toyota", "honda", "ford",
+    "tesla", "volvo", "peugeot", "renault", "opel", "kia", "hyundai",
+    # Tech brands
+    "apple", "samsung", "sony", "lg", "google", "microsoft", "amazon",
+    # Add more as needed
+])
+
+# Single alternation so all brands are matched in one pass over the question.
+# Longest names first, so overlapping brands prefer the most specific match.
+BRAND_RE = re.compile(
+    r"\b(?:" + "|".join(map(re.escape, sorted(BRAND_NAMES, key=len, reverse=True))) + r")\b"
+)
+
+# Separators between page name and site name in titles: " | ", " - ", " – ", " — "
+TITLE_SEPARATOR_RE = re.compile(r" [|\-\u2013\u2014] ")
+
+# Leading numbering like "Top 10" or "5 beste" in page titles
+NUMBER_PREFIX_RE = re.compile(r"^(?:top\s*)?\d+\s+", re.IGNORECASE)
+
+# Aho-Corasick automaton over the same brands, built once at import
+BRAND_AUTOMATON = None
+if AHOCORASICK_AVAILABLE:
+    BRAND_AUTOMATON = ahocorasick.Automaton()
+    for brand in BRAND_NAMES:
+        BRAND_AUTOMATON.add_word(brand, brand)
+    BRAND_AUTOMATON.make_automaton()
+
+
+def run_async(coro):
+    """Run a coroutine on the shared background event loop and wait for its result."""
+    return asyncio.run_coroutine_threadsafe(coro, async_loop).result()
+
+
+def start_page_context_from_ranking_extractor(url):
+    """
+    Start the ranking extractor on the shared event loop without waiting.
+    Returns a concurrent Future for the context string, so the caller can do
+    other work (like the PAA lookup) while the page is fetched and analysed.
+    """
+    return asyncio.run_coroutine_threadsafe(page_context_from_ranking_extractor_async(url), async_loop)
+
 
-def get_page_context_from_ranking_extractor(url):
+async def page_context_from_ranking_extractor_async(url):
     """
     Extract product information from the page using the integrated ranking extractor.
     Returns a formatted context string for PAA answer generation.
@@ -93,15 +469,11 @@ def get_page_context_from_ranking_extractor(url):
         return None
 
     try:
-        # Run async extractor in sync context
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            # Fetch and extract products
-            html, title = loop.run_until_complete(fetch_and_clean(url))
-            data = loop.run_until_complete(extract_products(html, url))
-        finally:
-            loop.close()
+        # Fetch and extract products
+        html, title = await fetch_and_clean(url)
+        if not html:
+            return None  # non-HTML or empty page, nothing to extract
+        data = await extract_products(html, url)
 
         # Extract relevant information
         main_topic = data.get("page", {}).get("main_topic", "")
@@ -163,52 +535,161 @@ def get_page_context_from_ranking_extractor(url):
         return None
 
 
+# XPath lookups for extract_page_info, compiled once instead of per page
+if LXML_AVAILABLE:
+    H1_XPATH = etree.XPath("(//h1)[1]")
+    TITLE_XPATH = etree.XPath("(//title)[1]")
+    OG_TITLE_XPATH = etree.XPath('(//meta[@property="og:title"]/@content)[1]')
+
+
+def _first_text(matches):
+    """Whitespace-collapsed text of the first element in an XPath result, or ""."""
+    if not matches:
+        return ""
+    return " ".join(matches[0].text_content().split())
+
+
+def _response_charset(response):
+    """Charset named in the response's Content-Type header, or None if it doesn't name one."""
+    if "charset" not in response.headers.get("Content-Type", "").lower():
+        return None
+    return requests.utils.get_encoding_from_headers(response.headers)
+
+
+def _parse_page_fields(body, encoding=None):
+    """
+    Parse the H1, <title> and og:title out of raw HTML bytes.
+    Returns an (h1, meta_title, og_title) tuple of stripped strings.
+
+    encoding is the charset from the HTTP headers; without it the parser
+    goes by the page's <meta charset>.
+    """
+    if not LXML_AVAILABLE:
+        soup = BeautifulSoup(body, "html.parser", from_encoding=encoding)
+        h1_tag = soup.find("h1")
+        title_tag = soup.find("title")
+        og_tag = soup.find("meta", property="og:title")
+        return (
+            h1_tag.get_text(" ", strip=True) if h1_tag else "",
+            title_tag.get_text(strip=True) if title_tag else "",
+            og_tag.get("content", "").strip() if og_tag else ""
+        )
+
+    # We only need three fields, so skip building a soup. A charset from the
+    # headers wins; otherwise lxml reads <meta charset> from the bytes.
+    parser = None
+    if encoding:
+        try:
+            parser = lxml.html.HTMLParser(encoding=encoding)
+        except LookupError:
+            pass  # unknown charset name
+    try:
+        tree = lxml.html.fromstring(body, parser=parser)
+    except etree.ParserError:
+        return ("", "", "")  # empty or whitespace-only body
+    og_titles = OG_TITLE_XPATH(tree)
+    return (
+        _first_text(H1_XPATH(tree)),
+        _first_text(TITLE_XPATH(tree)),
+        og_titles[0].strip() if og_titles else ""
+    )
+
+
+# Extra headers for page fetches (the User-Agent comes from http_session).
+# Ask for compressed HTML explicitly; only offer brotli when we can decode it.
+PAGE_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml",
+    "Accept-Encoding": "br, gzip" if BROTLI_AVAILABLE else "gzip"
+}
+
+
+def _read_page_head(response, max_bytes=65536, full_max_bytes=2 * 1024 * 1024):
+    """
+    Read a streamed response until both </head> and the first </h1> have
+    been received, or max_bytes have been read. The title, og:title and H1
+    are almost always in that prefix, so the rest of the page is skipped.
+
+    The H1 is the preferred keyword source, so if it hasn't appeared within
+    max_bytes the rest of the page is read too (up to full_max_bytes).
+    """
+    buffer = bytearray()
+    seen_head = seen_h1 = False
+    for chunk in response.iter_content(8192):
+        # Search from just before the new chunk so tags split across chunks are found
+        search_from = max(len(buffer) - 7, 0)
+        buffer += chunk
+        window = bytes(buffer[search_from:]).lower()
+        seen_head = seen_head or b"</head>" in window
+        seen_h1 = seen_h1 or b"</h1>" in window
+        if seen_h1 and (seen_head or len(buffer) >= max_bytes):
+            break
+        if len(buffer) >= full_max_bytes:
+            break
+    return bytes(buffer)
+
+
 def extract_page_info(url):
     """
     Extract H1 header and meta title from a URL.
     Returns a dictionary with h1, meta_title, and extracted keyword.
+    Results are cached per URL and revalidated with the page's ETag or
+    Last-Modified header once they are no longer fresh.
     """
     try:
         # Validate URL domain
-        from urllib.parse import urlparse
         parsed_url = urlparse(url)
         domain = parsed_url.netloc.replace("www.", "")
 
         if domain not in ALLOWED_DOMAINS:
             raise ValueError(f"Domein niet toegestaan. Gebruik alleen: {', '.join(ALLOWED_DOMAINS)}")
 
-        # Fetch the page
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36"
-        }
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-
-        # Parse HTML
-        soup = BeautifulSoup(response.text, "html.parser")
+        with page_info_cache_lock:
+            cached = page_info_cache.get(url)
+        if cached and time.monotonic() - cached["checked_at"] < PAGE_INFO_FRESH_SECONDS:
+            return dict(cached["info"])
 
-        # Extract H1
-        h1_tag = soup.find("h1")
-        h1_text = h1_tag.get_text(strip=True) if h1_tag else ""
+        headers = PAGE_HEADERS
+        if cached and (cached["etag"] or cached["last_modified"]):
+            headers = dict(PAGE_HEADERS)
+            if cached["etag"]:
+                headers["If-None-Match"] = cached["etag"]
+            if cached["last_modified"]:
+                headers["If-Modified-Since"] = cached["last_modified"]
 
-        # Extract meta title
-        title_tag = soup.find("title")
-        meta_title = title_tag.get_text(strip=True) if title_tag else ""
-
-        # Also try og:title as fallback
-        og_title_tag = soup.find("meta", property="og:title")
-        og_title = og_title_tag.get("content", "") if og_title_tag else ""
+        # Fetch the page
+        # Stream the page and stop once <head> and the first <h1> are in
+        with http_session.get(url, headers=headers, timeout=10, stream=True) as response:
+            if response.status_code == 304 and cached:
+                # Unchanged since the last fetch, so the parsed fields still hold
+                cached["checked_at"] = time.monotonic()
+                return dict(cached["info"])
+            response.raise_for_status()
+            body = _read_page_head(response)
+            encoding = _response_charset(response)
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+
+        # Extract H1, meta title and og:title (used as fallback)
+        h1_text, meta_title, og_title = _parse_page_fields(body, encoding)
 
         # Determine main keyword
         keyword = determine_main_keyword(h1_text, meta_title, og_title)
 
-        return {
+        info = {
             "h1": h1_text,
             "meta_title": meta_title,
             "og_title": og_title,
             "keyword": keyword,
             "url": url
         }
+        with page_info_cache_lock:
+            page_info_cache[url] = {
+                "info": info,
+                "etag": etag,
+                "last_modified": last_modified,
+                "checked_at": time.monotonic()
+            }
+        return dict(info)
 
     except requests.RequestException as e:
         raise ValueError(f"Kon de URL niet ophalen: {str(e)}")
@@ -223,10 +704,7 @@ def determine_main_keyword(h1, meta_title, og_title=""):
     Cleans up common patterns like "| Site Name" from titles.
     """
     # Clean up meta title (remove site name after | or -)
-    clean_title = meta_title
-    for separator in [" | ", " - ", " – ", " — "]:
-        if separator in clean_title:
-            clean_title = clean_title.split(separator)[0].strip()
+    clean_title = TITLE_SEPARATOR_RE.split(meta_title, maxsplit=1)[0].strip()
 
     # Priority: H1 if it's meaningful, otherwise cleaned title
     if h1 and len(h1) > 3:
@@ -243,7 +721,7 @@ def determine_main_keyword(h1, meta_title, og_title=""):
     keyword = keyword.strip()
 
     # Remove numbering like "Top 10", "5 beste"
-    keyword = re.sub(r"^(top\s*)?\d+\s+", "", keyword, flags=re.IGNORECASE)
+    keyword = NUMBER_PREFIX_RE.sub("", keyword)
 
     # Limit length (Google works better with shorter queries)
     words = keyword.split()
@@ -253,37 +731,16 @@ def determine_main_keyword(h1, meta_title, og_title=""):
     return keyword.strip()
 
 
-def generate_answer(question, page_context=""):
-    """
-    Generate a well-formatted answer for a FAQ question using OpenAI.
+# Bump whenever the answer prompts change, so cached answers written with
+# the old prompts are no longer used
+ANSWER_PROMPT_VERSION = 1
 
-    Follows strict PAA writing rules:
-    - Direct answer first (1-2 sentences)
-    - 40-120 words
-    - Neutral, factual tone
-    - No first-person, no opinions
-    - Clear, simple language
+# Writing rules for generated PAA answers. Everything static lives in the
+# system prompt so it forms an identical prefix on every request, which lets
+# OpenAI's prompt caching reuse it; only context and questions vary.
+ANSWER_SYSTEM_PROMPT = """Je bent een professionele Nederlandse content schrijver die directe, feitelijke, neutrale antwoorden geeft zonder eerste persoon.
 
-    The AI will decide if page_context is relevant to the question.
-    """
-    if not openai_client:
-        return None
-
-    try:
-        context_instruction = ""
-        if page_context:
-            context_instruction = f"""
-PAGINA CONTEXT (gebruik ALLEEN als relevant voor de vraag):
-{page_context}
-
-BELANGRIJKE REGEL OVER CONTEXT:
-- Gebruik de pagina context ALLEEN als deze direct relevant is voor de vraag
-- Als de vraag over een specifiek product/model gaat en dit staat in de context: gebruik het
-- Als de vraag algemeen is ("Wat is...?", "Hoe werkt...?") en de context geen directe waarde toevoegt: negeer de context
-- Forceer NOOIT informatie uit de context als het niet natuurlijk past bij de vraag
-"""
-
-        prompt = f"""Je bent een professionele content schrijver. Beantwoord de vraag volgens deze strikte regels:
+Beantwoord vragen volgens deze strikte regels:
 
 MANDATORY RULES:
 
@@ -327,80 +784,288 @@ MANDATORY RULES:
 
 8. ORIGINALITY
    - Vermijd generieke zinnen die veel voorkomen
-   - Voeg duidelijkheid of nuance toe waar mogelijk
+   - Voeg duidelijkheid of nuance toe waar mogelijk"""
+
+
+def _context_instruction(page_context):
+    """Prompt section that offers the ranking-extractor context to the model."""
+    if not page_context:
+        return ""
+    return f"""
+PAGINA CONTEXT (gebruik ALLEEN als relevant voor de vraag):
+{page_context}
+
+BELANGRIJKE REGEL OVER CONTEXT:
+- Gebruik de pagina context ALLEEN als deze direct relevant is voor de vraag
+- Als de vraag over een specifiek product/model gaat en dit staat in de context: gebruik het
+- Als de vraag algemeen is ("Wat is...?", "Hoe werkt...?") en de context geen directe waarde toevoegt: negeer de context
+- Forceer NOOIT informatie uit de context als het niet natuurlijk past bij de vraag
+"""
 
-{context_instruction}
+
+def _limit_words(answer, max_words=120):
+    """Ensure an answer stays within the 40-120 word target."""
+    words = answer.split()
+    if len(words) > max_words:
+        answer = " ".join(words[:max_words]) + "..."
+    return answer
+
+
+async def _create_completion(**kwargs):
+    """Chat completion with exponential backoff on rate limits and timeouts."""
+    from openai import APITimeoutError, RateLimitError
+
+    client = get_openai_client()
+    for attempt in range(3):
+        try:
+            return await client.chat.completions.create(**kwargs)
+        except (RateLimitError, APITimeoutError):
+            if attempt == 2:
+                raise
+            await asyncio.sleep(2 ** attempt)
+
+
+def _answer_request(question, page_context=""):
+    """Chat completion parameters for answering a single question."""
+    prompt = f"""{_context_instruction(page_context)}
 
 Vraag: {question}
 
-Antwoord (40-120 woorden, direct, neutraal, zonder eerste persoon):"""
+Antwoord (40-120 woorden, direct, neutraal, zonder eerste persoon):""".strip()
+
+    return {
+        "model": ANSWER_MODEL,
+        "messages": [
+            {"role": "system", "content": ANSWER_SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ],
+        "max_tokens": 200,
+        "temperature": 0.5
+    }
+
+
+async def generate_answer_async(question, page_context=""):
+    """
+    Generate a well-formatted answer for a FAQ question using OpenAI.
+
+    Follows strict PAA writing rules:
+    - Direct answer first (1-2 sentences)
+    - 40-120 words
+    - Neutral, factual tone
+    - No first-person, no opinions
+    - Clear, simple language
+
+    The AI will decide if page_context is relevant to the question.
+    """
+    if not get_openai_client():
+        return None
+
+    try:
+        response = await _create_completion(**_answer_request(question, page_context))
+
+        return _limit_words(response.choices[0].message.content.strip())
+
+    except Exception as e:
+        print(f"Error generating answer: {e}")
+        return None
+
+
+async def generate_answers_batch(questions, page_context=""):
+    """
+    Generate answers for several FAQ questions in a single OpenAI request.
+
+    The writing rules and page context are sent once for the whole batch,
+    and the model returns a JSON object with one answer per question.
+    Returns None if the request fails or the answers don't line up with
+    the questions, so the caller can fall back to one request per question.
+    """
+    if not get_openai_client():
+        return None
+
+    try:
+        numbered = "\n".join(f"{i}. {question}" for i, question in enumerate(questions, 1))
+        prompt = f"""{_context_instruction(page_context)}
 
-        response = openai_client.chat.completions.create(
-            model="gpt-4o-mini",
+Beantwoord elk van de onderstaande vragen.
+
+Vragen:
+{numbered}
+
+Geef het resultaat als JSON object {{"answers": [...]}} met precies {len(questions)} antwoorden, in dezelfde volgorde als de vragen (elk 40-120 woorden, direct, neutraal, zonder eerste persoon).""".strip()
+
+        response = await _create_completion(
+            model=ANSWER_MODEL,
             messages=[
-                {"role": "system", "content": "Je bent een professionele Nederlandse content schrijver die directe, feitelijke, neutrale antwoorden geeft zonder eerste persoon."},
+                {"role": "system", "content": ANSWER_SYSTEM_PROMPT},
                 {"role": "user", "content": prompt}
             ],
-            max_tokens=200,
+            response_format={"type": "json_object"},
+            max_tokens=200 * len(questions),
             temperature=0.5
         )
 
-        answer = response.choices[0].message.content.strip()
-
-        # Ensure answer is within 40-120 words
-        words = answer.split()
-        if len(words) > 120:
-            answer = " ".join(words[:120]) + "..."
+        answers = json.loads(response.choices[0].message.content).get("answers", [])
+        if len(answers) != len(questions) or not all(isinstance(a, str) and a.strip() for a in answers):
+            print(f"Batch answer count mismatch ({len(answers)} for {len(questions)} questions)")
+            return None
 
-        return answer
+        return [_limit_words(answer.strip()) for answer in answers]
 
     except Exception as e:
-        print(f"Error generating answer: {e}")
+        print(f"Error generating batch answers: {e}")
         return None
 
 
-def is_relevant_question(question, keyword):
+async def _gather_answers(questions, page_context=None):
     """
-    Determine if a question is relevant to the keyword.
-    Returns True if relevant, False if less relevant (contains brand names, etc.)
+    Generate answers for all questions, ANSWER_BATCH_SIZE questions per
+    request and at most OPENAI_CONCURRENCY requests at a time.
     """
-    question_lower = question.lower()
-    keyword_lower = keyword.lower()
+    semaphore = asyncio.Semaphore(OPENAI_CONCURRENCY)
 
-    # Common coffee machine brands (example)
-    brand_names = [
-        "jura", "delonghi", "de'longhi", "philips", "nespresso", "senseo",
-        "dolce gusto", "siemens", "bosch", "melitta", "krups", "saeco",
-        "moccamaster", "bialetti", "lavazza", "illy", "sage", "breville",
-        # Car brands
-        "bmw", "mercedes", "audi", "volkswagen", "toyota", "honda", "ford",
-        "tesla", "volvo", "peugeot", "renault", "opel", "kia", "hyundai",
-        # Tech brands
-        "apple", "samsung", "sony", "lg", "google", "microsoft", "amazon",
-        # Add more as needed
-    ]
+    async def bounded(question):
+        async with semaphore:
+            return await generate_answer_async(question, page_context)
 
-    # Check if question contains the keyword - likely relevant
-    keyword_words = keyword_lower.split()
-    contains_keyword = any(word in question_lower for word in keyword_words if len(word) > 2)
+    async def batch(chunk):
+        async with semaphore:
+            answers = await generate_answers_batch(chunk, page_context)
+        if answers is None:
+            # Fall back to one request per question
+            answers = await asyncio.gather(*(bounded(question) for question in chunk))
+        return answers
 
-    # Check if question contains brand names - less relevant if brand not in keyword
-    contains_brand = False
-    for brand in brand_names:
-        if brand in question_lower and brand not in keyword_lower:
-            contains_brand = True
-            break
+    chunks = [questions[i:i + ANSWER_BATCH_SIZE] for i in range(0, len(questions), ANSWER_BATCH_SIZE)]
+    batches = await asyncio.gather(*(batch(chunk) for chunk in chunks))
+    return [answer for answers in batches for answer in answers]
+
+
+def _answer_cache_key(question, page_context):
+    """Cache key for a generated answer: hash of model, prompt version, question and page context."""
+    raw = f"{ANSWER_MODEL}\x00{ANSWER_PROMPT_VERSION}\x00{question}\x00{page_context or ''}"
+    return hashlib.blake2b(raw.encode(), digest_size=16).digest()
+
+
+def _get_cached_answer(key):
+    """Look up a generated answer in memory, then on disk. Returns None on a miss."""
+    with answer_cache_lock:
+        answer = answer_cache.get(key)
+    if answer is None and answer_disk_cache is not None:
+        try:
+            answer = answer_disk_cache.get(key)
+        except Exception as e:
+            print(f"Answer disk cache read failed: {e}")
+        if answer is not None:
+            with answer_cache_lock:
+                answer_cache[key] = answer
+    return answer
+
+
+def _store_answer(key, answer):
+    """Store a generated answer in memory and on disk."""
+    with answer_cache_lock:
+        answer_cache[key] = answer
+    if answer_disk_cache is not None:
+        try:
+            answer_disk_cache.set(key, answer, expire=ANSWER_DISK_CACHE_TTL)
+        except Exception as e:
+            print(f"Answer disk cache write failed: {e}")
+
+
+def fill_generated_answers(results, page_context=None):
+    """
+    Generate AI answers for a list of PAAItems and store them on the items.
+    Questions marked as not relevant are skipped. Answers already generated
+    for the same question and page context are reused from the answer cache;
+    only the rest go to OpenAI.
+    """
+    missing = []
+    for result in results:
+        if not result.relevant:
+            continue
+        cached = _get_cached_answer(_answer_cache_key(result.question, page_context))
+        if cached is not None:
+            result.generated_answer = cached
+        else:
+            missing.append(result)
+
+    if not missing:
+        return
+
+    answers = run_async(_gather_answers([result.question for result in missing], page_context))
+    for result, answer in zip(missing, answers):
+        result.generated_answer = answer
+        # Failed generations aren't cached so they are retried next time
+        if answer:
+            _store_answer(_answer_cache_key(result.question, page_context), answer)
+
+
+def _is_word_char(char):
+    """Same notion of a word character as the regex \\b boundary."""
+    return char.isalnum() or char == "_"
+
+
+def find_brands(text):
+    """
+    Yield every brand name that occurs as a whole word in text.
+    Expects lowercase text. Uses the Aho-Corasick automaton when available,
+    otherwise the precompiled regex.
+    """
+    if BRAND_AUTOMATON is None:
+        for match in BRAND_RE.finditer(text):
+            yield match.group(0)
+        return
+
+    for end, brand in BRAND_AUTOMATON.iter(text):
+        start = end - len(brand) + 1
+        if start > 0 and _is_word_char(text[start - 1]):
+            continue
+        if end + 1 < len(text) and _is_word_char(text[end + 1]):
+            continue
+        yield brand
+
+
+@dataclass(slots=True, frozen=True)
+class KeywordContext:
+    """A keyword normalized once per scrape for the relevance checks."""
+    lower: str
+    words: frozenset[str]
+    brands_in_keyword: frozenset[str]
+
+
+def build_keyword_context(keyword):
+    """
+    Build the KeywordContext for a keyword. words holds the words longer than
+    2 characters; brands_in_keyword the brand names the keyword itself mentions.
+    """
+    keyword_lower = keyword.lower()
+    return KeywordContext(
+        lower=keyword_lower,
+        words=frozenset(word for word in keyword_lower.split() if len(word) > 2),
+        brands_in_keyword=frozenset(brand for brand in BRAND_NAMES if brand in keyword_lower)
+    )
+
+
+def is_relevant_question(question, keyword_ctx):
+    """
+    Determine if a question is relevant to the keyword.
+    Returns True if relevant, False if less relevant (contains brand names, etc.)
 
-    # Relevant if contains keyword and no unrelated brand
-    if contains_keyword and not contains_brand:
+    keyword_ctx is the KeywordContext returned by build_keyword_context().
+    """
+    # Nothing meaningful to compare against (e.g. only very short words)
+    if not keyword_ctx.words:
         return True
 
-    # Less relevant if contains brand not in keyword
-    if contains_brand:
+    question_lower = question.lower()
+
+    # Doesn't contain the keyword - less relevant, no need to scan for brands
+    if not any(word in question_lower for word in keyword_ctx.words):
         return False
 
-    # Default: if doesn't contain keyword, less relevant
-    return contains_keyword
+    # Contains the keyword - relevant unless it names a brand not in the keyword
+    brands_in_keyword = keyword_ctx.brands_in_keyword
+    return all(brand in brands_in_keyword for brand in find_brands(question_lower))
 
 
 def get_domain_from_url(url):
@@ -415,23 +1080,38 @@ def get_sheet_for_domain(domain):
     if not sheets_client or not GOOGLE_SPREADSHEET_ID:
         return None
 
+    global spreadsheet_handle
+
     try:
-        spreadsheet = sheets_client.open_by_key(GOOGLE_SPREADSHEET_ID)
+        with worksheet_cache_lock:
+            sheet = worksheet_cache.get(domain)
+            if sheet is not None:
+                return sheet
 
-        # Try to get existing sheet for this domain
-        try:
-            sheet = spreadsheet.worksheet(domain)
-        except gspread.WorksheetNotFound:
-            # Create new sheet with headers
-            sheet = spreadsheet.add_worksheet(title=domain, rows=1000, cols=10)
-            sheet.append_row(["URL", "keyword", "PAA", "answer", "publish", "status"])
+            if spreadsheet_handle is None:
+                spreadsheet_handle = sheets_client.open_by_key(GOOGLE_SPREADSHEET_ID)
 
-        return sheet
+            # Try to get existing sheet for this domain
+            try:
+                sheet = spreadsheet_handle.worksheet(domain)
+            except gspread.WorksheetNotFound:
+                # Create new sheet with headers
+                sheet = spreadsheet_handle.add_worksheet(title=domain, rows=1000, cols=10)
+                sheet.append_row(["URL", "keyword", "PAA", "answer", "publish", "status"])
+
+            worksheet_cache[domain] = sheet
+            return sheet
     except Exception as e:
         print(f"Error getting sheet for domain {domain}: {e}")
         return None
 
 
+def forget_sheet_for_domain(domain):
+    """Drop a cached worksheet handle, e.g. after the tab was deleted or renamed."""
+    with worksheet_cache_lock:
+        worksheet_cache.pop(domain, None)
+
+
 def save_results_to_sheets(url, keyword, results):
     """
     Save PAA results to Google Sheets.
@@ -455,19 +1135,22 @@ def save_results_to_sheets(url, keyword, results):
     if not sheet:
         return {"error": "Could not access spreadsheet"}
 
-    rows_added = 0
-    try:
-        for result in results:
-            question = result.get("question", "")
-            # Use generated answer if available, otherwise use scraped answer
-            answer = result.get("generated_answer") or result.get("answer", "")
-
-            row = [url, keyword, question, answer, "", ""]  # publish and status empty
-            sheet.append_row(row)
-            rows_added += 1
+    # Use generated answer if available, otherwise use scraped answer;
+    # publish and status stay empty
+    rows = [
+        [url, keyword, result.get("question", ""), result.get("generated_answer") or result.get("answer", ""), "", ""]
+        for result in results
+    ]
+    if not rows:
+        return {"success": True, "rows_added": 0}
 
-        return {"success": True, "rows_added": rows_added}
+    try:
+        # One API call for all rows instead of one per row
+        sheet.append_rows(rows, value_input_option="RAW", insert_data_option="INSERT_ROWS")
+        return {"success": True, "rows_added": len(rows)}
     except Exception as e:
+        # The cached handle may be stale; resolve the tab again next time
+        forget_sheet_for_domain(domain)
         return {"error": str(e)}
 
 
@@ -481,10 +1164,25 @@ def get_wp_credentials(domain):
     return None
 
 
+def _find_wp_item(api_base, item_type, slug, headers):
+    """Look up a WordPress page or post ("pages"/"posts") by slug. Returns None if not found."""
+    try:
+        response = http_session.get(f"{api_base}/{item_type}?slug={slug}", headers=headers, timeout=10)
+        if response.status_code == 200:
+            items = response.json()
+            if items:
+                return {"id": items[0]["id"], "type": item_type, "content": items[0]["content"]["rendered"]}
+    except Exception:
+        pass
+    return None
+
+
 def find_wp_page_by_url(page_url, wp_site):
     """
     Find a WordPress page/post by its URL.
-    Returns the page/post ID and type if found.
+    Returns the page/post ID and type if found, with its current content.
+    The ID and type are cached per URL; content is always fetched fresh since
+    publishing appends to it.
     """
     parsed = urlparse(page_url)
     slug = parsed.path.strip("/").split("/")[-1]  # Get the last part of the path
@@ -492,37 +1190,38 @@ def find_wp_page_by_url(page_url, wp_site):
     if not slug:
         return None
 
-    # Create auth header
-    auth_string = f"{wp_site['user']}:{wp_site['password']}"
-    auth_bytes = base64.b64encode(auth_string.encode()).decode()
     headers = {
-        "Authorization": f"Basic {auth_bytes}",
+        "Authorization": wp_site["auth_header"],
         "Content-Type": "application/json"
     }
 
     api_base = f"{wp_site['url']}/wp-json/wp/v2"
 
-    # Try to find as page first
-    try:
-        response = requests.get(f"{api_base}/pages?slug={slug}", headers=headers, timeout=10)
-        if response.status_code == 200:
-            pages = response.json()
-            if pages:
-                return {"id": pages[0]["id"], "type": "pages", "content": pages[0]["content"]["rendered"]}
-    except Exception:
-        pass
-
-    # Try to find as post
-    try:
-        response = requests.get(f"{api_base}/posts?slug={slug}", headers=headers, timeout=10)
-        if response.status_code == 200:
-            posts = response.json()
-            if posts:
-                return {"id": posts[0]["id"], "type": "posts", "content": posts[0]["content"]["rendered"]}
-    except Exception:
-        pass
-
-    return None
+    # Known page: fetch only its current content by ID, skipping the slug search
+    with wp_lookup_cache_lock:
+        cached = wp_lookup_cache.get(page_url)
+    if cached:
+        try:
+            response = http_session.get(
+                f"{api_base}/{cached['type']}/{cached['id']}?_fields=id,content",
+                headers=headers,
+                timeout=10
+            )
+            if response.status_code == 200:
+                return {"id": cached["id"], "type": cached["type"], "content": response.json()["content"]["rendered"]}
+        except Exception:
+            pass
+        # Deleted or moved; look it up by slug again
+        with wp_lookup_cache_lock:
+            wp_lookup_cache.pop(page_url, None)
+
+    # Look up the slug as page and as post at the same time; pages win
+    post_future = wp_executor.submit(_find_wp_item, api_base, "posts", slug, headers)
+    found = _find_wp_item(api_base, "pages", slug, headers) or post_future.result()
+    if found:
+        with wp_lookup_cache_lock:
+            wp_lookup_cache[page_url] = {"id": found["id"], "type": found["type"]}
+    return found
 
 
 def publish_to_wordpress(page_url, question, answer):
@@ -556,17 +1255,15 @@ def publish_to_wordpress(page_url, question, answer):
     new_content = page_info["content"] + faq_html
 
     # Update the page
-    auth_string = f"{wp_site['user']}:{wp_site['password']}"
-    auth_bytes = base64.b64encode(auth_string.encode()).decode()
     headers = {
-        "Authorization": f"Basic {auth_bytes}",
+        "Authorization": wp_site["auth_header"],
         "Content-Type": "application/json"
     }
 
     api_url = f"{wp_site['url']}/wp-json/wp/v2/{page_info['type']}/{page_info['id']}"
 
     try:
-        response = requests.post(
+        response = http_session.post(
             api_url,
             headers=headers,
             json={"content": new_content},
@@ -581,8 +1278,23 @@ def publish_to_wordpress(page_url, question, answer):
         return {"error": str(e)}
 
 
-def parse_question(item, keyword="", generate_ai_answer=False, page_context=None):
-    """Parse a single question item from SerpAPI response."""
+@dataclass(slots=True)
+class PAAItem:
+    """A single 'People Also Ask' result."""
+    question: str
+    answer: str
+    generated_answer: str | None
+    source_title: str
+    source_url: str
+    relevant: bool
+
+
+def parse_question(item, keyword_ctx=None):
+    """
+    Parse a single question item from SerpAPI response into a PAAItem.
+    keyword_ctx is the KeywordContext returned by build_keyword_context(), or None to
+    skip the relevance check.
+    """
     question = item.get("question", "")
 
     # Get answer from text_blocks (first paragraph)
@@ -603,28 +1315,147 @@ def parse_question(item, keyword="", generate_ai_answer=False, page_context=None
         source_url = first_ref.get("link", "")
 
     # Determine relevance
-    relevant = is_relevant_question(question, keyword) if keyword else True
+    relevant = is_relevant_question(question, keyword_ctx) if keyword_ctx else True
+
+    return PAAItem(
+        question=question,
+        answer=answer,
+        generated_answer=None,
+        source_title=source_title,
+        source_url=source_url,
+        relevant=relevant
+    )
 
-    # Generate AI answer if requested
-    generated_answer = None
-    if generate_ai_answer and question:
-        generated_answer = generate_answer(question, page_context)
 
-    return {
-        "question": question,
-        "answer": answer,
-        "generated_answer": generated_answer,
-        "source_title": source_title,
-        "source_url": source_url,
-        "next_page_token": item.get("next_page_token", ""),
-        "relevant": relevant
-    }
+def _question_key(question):
+    """
+    Compact deduplication key for a question. Ignores casing, accents and
+    whitespace differences, and stores an 8-byte digest instead of the text
+    (plenty for the few dozen questions of one scrape). Returns None for
+    empty questions.
+    """
+    folded = unicodedata.normalize("NFKD", question).encode("ascii", "ignore").decode() or question
+    normalized = " ".join(folded.lower().split())
+    if not normalized:
+        return None
+    return hashlib.blake2b(normalized.encode(), digest_size=8).digest()
+
 
+def _serpapi_cache_key(params):
+    """Stable cache key for a SerpAPI request (the api_key and no_cache flag are left out)."""
+    cacheable = {k: v for k, v in params.items() if k not in ("api_key", "no_cache")}
+    digest = hashlib.blake2b(json.dumps(cacheable, sort_keys=True).encode(), digest_size=16)
+    return f"serpapi:{digest.hexdigest()}"
+
+
+def _serpapi_get(params, max_attempts=3, use_cache=True, refresh=False):
+    """
+    Run a SerpAPI search and return the JSON response.
 
-def scrape_people_also_ask(keyword, expand_questions=True, max_results=20, generate_answers=False, page_context=None):
+    Successful responses are cached in memory (and in Redis when configured)
+    for SERPAPI_CACHE_TTL seconds, so identical requests don't cost credits.
+    Pass use_cache=False to always go to SerpAPI, or refresh=True to skip
+    cached responses but still cache the new one.
+    """
+    if not use_cache:
+        return _serpapi_fetch(params, max_attempts=max_attempts)
+
+    cache_key = _serpapi_cache_key(params)
+
+    if not refresh:
+        with serpapi_cache_lock:
+            cached = serpapi_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    if redis_client and not refresh:
+        try:
+            blob = redis_client.get(cache_key)
+            if blob:
+                data = json.loads(blob)
+                with serpapi_cache_lock:
+                    serpapi_cache[cache_key] = data
+                return data
+        except Exception as e:
+            print(f"Redis read failed: {e}")
+
+    data = _serpapi_fetch(params, max_attempts=max_attempts)
+
+    # Don't cache errors, they should be retried on the next request
+    if "error" not in data:
+        with serpapi_cache_lock:
+            serpapi_cache[cache_key] = data
+        if redis_client:
+            try:
+                redis_client.setex(cache_key, SERPAPI_CACHE_TTL, json.dumps(data))
+            except Exception as e:
+                print(f"Redis write failed: {e}")
+
+    return data
+
+
+def _serpapi_fetch(params, max_attempts=3):
+    """
+    Send a SerpAPI request over the shared session and return the JSON response.
+    Requests go through the rate limiter; a 429 pauses the limiter for
+    Retry-After seconds and is retried up to max_attempts times.
+    """
+    for attempt in range(max_attempts):
+        serpapi_throttle.acquire()
+        try:
+            response = http_session.get(SERPAPI_URL, params=params, timeout=15)
+        except Exception:
+            serpapi_throttle.release()
+            raise
+
+        serpapi_throttle.release(response.status_code, response.headers)
+
+        if response.status_code != 429:
+            break
+
+    return response.json()
+
+
+def _fetch_expansion(token, refresh=False):
+    """
+    Fetch the related questions behind a single next_page_token.
+    Returns an empty list if the request fails, so one failed expansion
+    doesn't take down the others.
+    """
+    try:
+        expand_params = {
+            "engine": "google_related_questions",
+            "next_page_token": token,
+            "api_key": SERPAPI_KEY
+        }
+        if refresh:
+            expand_params["no_cache"] = "true"
+        expand_data = _serpapi_get(expand_params, refresh=refresh)
+        return expand_data.get("related_questions", [])
+    except Exception:
+        return []  # Skip failed expansions
+
+
+def _append_result(results, seen_questions, item, keyword_ctx):
+    """
+    Parse a SerpAPI question item and append it to results, unless the
+    question is empty or already seen. Returns True if it was appended.
+    """
+    # Skip duplicates before paying for parsing
+    question_key = _question_key(item.get("question", ""))
+    if not question_key or question_key in seen_questions:
+        return False
+    seen_questions.add(question_key)
+
+    results.append(parse_question(item, keyword_ctx))
+    return True
+
+
+def scrape_people_also_ask(keyword, expand_questions=True, max_results=20, generate_answers=False, page_context=None,
+                           hl="nl", gl="nl", refresh=False):
     """
     Get the 'People Also Ask' section from Google.nl using SerpAPI.
-    Returns a list of dictionaries with question, answer, and source information.
+    Returns a list of PAAItem records with question, answer, and source information.
 
     Args:
         keyword: Search keyword
@@ -632,6 +1463,9 @@ def scrape_people_also_ask(keyword, expand_questions=True, max_results=20, gener
         max_results: Maximum number of results to return
         generate_answers: If True, generate AI answers for each question
         page_context: Optional context from ranking extractor for smarter answers
+        hl: Interface language for the search
+        gl: Country for the search
+        refresh: If True, bypass cached SerpAPI responses (ours and SerpAPI's own)
     """
     if not SERPAPI_KEY:
         raise ValueError("SERPAPI_KEY environment variable not set")
@@ -639,19 +1473,23 @@ def scrape_people_also_ask(keyword, expand_questions=True, max_results=20, gener
     results = []
     seen_questions = set()
 
+    # Normalize the keyword once instead of for every question
+    keyword_ctx = build_keyword_context(keyword) if keyword else None
+
     try:
         # Configure search for Dutch Google
         params = {
             "engine": "google",
             "q": keyword,
             "google_domain": "google.nl",
-            "gl": "nl",  # Country: Netherlands
-            "hl": "nl",  # Language: Dutch
+            "gl": gl,  # Country: Netherlands by default
+            "hl": hl,  # Language: Dutch by default
             "api_key": SERPAPI_KEY
         }
+        if refresh:
+            params["no_cache"] = "true"
 
-        search = GoogleSearch(params)
-        data = search.get_dict()
+        data = _serpapi_get(params, refresh=refresh)
 
         # Extract "People Also Ask" questions (SerpAPI uses different keys)
         related_questions = data.get("related_questions", [])
@@ -664,59 +1502,139 @@ def scrape_people_also_ask(keyword, expand_questions=True, max_results=20, gener
         tokens_to_expand = []
 
         for item in related_questions:
-            parsed = parse_question(item, keyword, generate_ai_answer=generate_answers, page_context=page_context)
-            if parsed["question"] and parsed["question"] not in seen_questions:
-                seen_questions.add(parsed["question"])
-                results.append({
-                    "question": parsed["question"],
-                    "answer": parsed["answer"],
-                    "generated_answer": parsed["generated_answer"],
-                    "source_title": parsed["source_title"],
-                    "source_url": parsed["source_url"],
-                    "relevant": parsed["relevant"]
-                })
-                if parsed["next_page_token"]:
-                    tokens_to_expand.append(parsed["next_page_token"])
+            if _append_result(results, seen_questions, item, keyword_ctx) and item.get("next_page_token"):
+                tokens_to_expand.append(item["next_page_token"])
 
         # Expand questions to get more results (uses additional API credits)
-        if expand_questions and tokens_to_expand:
-            for token in tokens_to_expand[:3]:  # Limit to 3 expansions to save credits
+        if expand_questions and tokens_to_expand and len(results) < max_results:
+            tokens = tokens_to_expand[:3]  # Limit to 3 expansions to save credits
+
+            # Expansions are independent requests, so fetch them concurrently
+            # and start merging as soon as the first one is back
+            futures = [serpapi_executor.submit(_fetch_expansion, token, refresh) for token in tokens]
+
+            for future in futures:
                 if len(results) >= max_results:
                     break
 
-                try:
-                    expand_params = {
-                        "engine": "google_related_questions",
-                        "next_page_token": token,
-                        "api_key": SERPAPI_KEY
-                    }
-                    expand_search = GoogleSearch(expand_params)
-                    expand_data = expand_search.get_dict()
-
-                    for item in expand_data.get("related_questions", []):
-                        if len(results) >= max_results:
-                            break
-                        parsed = parse_question(item, keyword, generate_ai_answer=generate_answers, page_context=page_context)
-                        if parsed["question"] and parsed["question"] not in seen_questions:
-                            seen_questions.add(parsed["question"])
-                            results.append({
-                                "question": parsed["question"],
-                                "answer": parsed["answer"],
-                                "generated_answer": parsed["generated_answer"],
-                                "source_title": parsed["source_title"],
-                                "source_url": parsed["source_url"],
-                                "relevant": parsed["relevant"]
-                            })
-                except Exception:
-                    continue  # Skip failed expansions
+                for item in future.result():
+                    if len(results) >= max_results:
+                        break
+                    _append_result(results, seen_questions, item, keyword_ctx)
 
     except Exception as e:
         print(f"Error during SerpAPI request: {e}")
         raise
 
+    # Generate AI answers for all questions at once instead of one by one
+    if generate_answers and results:
+        fill_generated_answers(results, page_context)
+
     return results
 
 
+def _shared_paa_key(cache_key):
+    keyword, expand_questions, max_results, hl, gl = cache_key
+    raw = f"{keyword}|{int(expand_questions)}|{max_results}|{hl}|{gl}"
+    return "paa:" + hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+def _get_shared_paa(cache_key):
+    """Look up PAA results in Redis, so all workers share one cache. Returns None on a miss."""
+    if not redis_client:
+        return None
+    try:
+        blob = redis_client.get(_shared_paa_key(cache_key))
+        if blob:
+            return [PAAItem(**item) for item in json.loads(blob)]
+    except Exception as e:
+        print(f"Redis read failed: {e}")
+    return None
+
+
+def _set_shared_paa(cache_key, results):
+    """Store PAA results in Redis for PAA_CACHE_TTL seconds."""
+    if not redis_client:
+        return
+    try:
+        blob = json.dumps([asdict(result) for result in results])
+        redis_client.setex(_shared_paa_key(cache_key), PAA_CACHE_TTL, blob)
+    except Exception as e:
+        print(f"Redis write failed: {e}")
+
+
+def get_people_also_ask(keyword, expand_questions=True, max_results=20, generate_answers=False, page_context=None,
+                        hl="nl", gl="nl", refresh=False):
+    """
+    Cached wrapper around scrape_people_also_ask, shared by every route.
+    Repeat requests for the same keyword (e.g. viewing results and then
+    downloading the CSV) are served from memory, or from Redis when another
+    worker already scraped it, instead of SerpAPI. Concurrent requests for a
+    keyword share a single in-flight scrape.
+
+    With generate_answers, AI answers are filled in on copies of the cached
+    results, since they depend on page_context and must not leak into the
+    shared cache. refresh=True skips the caches and stores a fresh scrape.
+    """
+    results = _get_cached_people_also_ask(keyword, expand_questions, max_results, hl, gl, refresh)
+    if generate_answers and results:
+        results = with_generated_answers(results, page_context)
+    return results
+
+
+def with_generated_answers(results, page_context=None):
+    """Copies of cached PAAItems with AI answers filled in for page_context."""
+    results = [replace(result) for result in results]
+    fill_generated_answers(results, page_context)
+    return results
+
+
+def _get_cached_people_also_ask(keyword, expand_questions, max_results, hl, gl, refresh):
+    """PAA results from memory, Redis or a single-flight scrape, in that order."""
+    cache_key = (keyword.lower().strip(), expand_questions, max_results, hl, gl)
+
+    with paa_cache_lock:
+        cached = None if refresh else paa_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Forced rescrapes get their own in-flight slot, so they never reuse
+        # a normal scrape that was already running
+        inflight_key = (cache_key, refresh)
+        future = paa_inflight.get(inflight_key)
+        is_leader = future is None
+        if is_leader:
+            future = Future()
+            paa_inflight[inflight_key] = future
+
+    if not is_leader:
+        return future.result()
+
+    try:
+        results = None if refresh else _get_shared_paa(cache_key)
+        if results is None:
+            results = scrape_people_also_ask(
+                keyword,
+                expand_questions=expand_questions,
+                max_results=max_results,
+                hl=hl,
+                gl=gl,
+                refresh=refresh
+            )
+            _set_shared_paa(cache_key, results)
+    except Exception as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(results)
+        with paa_cache_lock:
+            paa_cache[cache_key] = results
+        return results
+    finally:
+        with paa_cache_lock:
+            paa_inflight.pop(inflight_key, None)
+
+
 @app.route("/", methods=["GET", "POST"])
 def index():
     """Main page with keyword form and results display."""
@@ -737,7 +1655,7 @@ def index():
             error = "OPENAI_API_KEY is niet geconfigureerd. Voeg deze toe om antwoorden te genereren."
         else:
             try:
-                results = scrape_people_also_ask(keyword, generate_answers=generate_answers)
+                results = get_people_also_ask(keyword, generate_answers=generate_answers)
                 if not results:
                     error = "Geen 'Mensen vragen ook' vragen gevonden voor dit zoekwoord."
             except Exception as e:
@@ -787,21 +1705,26 @@ def url_search():
                 if not keyword:
                     error = "Kon geen zoekwoord bepalen uit de pagina."
                 else:
-                    # Get page context from ranking extractor (if available)
-                    page_context = None
+                    # Get page context from ranking extractor (if available),
+                    # in the background while PAA is fetched
+                    context_future = None
                     if generate_answers:
-                        page_context = get_page_context_from_ranking_extractor(url)
+                        context_future = start_page_context_from_ranking_extractor(url)
+
+                    # Search PAA with extracted keyword
+                    results = get_people_also_ask(keyword)
+
+                    if context_future:
+                        page_context = context_future.result()
                         if page_context:
                             print(f"✓ Got product context from ranking extractor ({len(page_context)} chars)")
                         else:
                             print("⚠ No product context from ranking extractor (not running or no products found)")
 
-                    # Search PAA with extracted keyword and page context
-                    results = scrape_people_also_ask(
-                        keyword,
-                        generate_answers=generate_answers,
-                        page_context=page_context
-                    )
+                        # Generate answers with the page context
+                        if results:
+                            results = with_generated_answers(results, page_context)
+
                     if not results:
                         error = "Geen 'Mensen vragen ook' vragen gevonden voor dit zoekwoord."
 
@@ -823,6 +1746,106 @@ def url_search():
     )
 
 
+def _save_batch_job(job_id, job):
+    """Remember which keyword and questions an OpenAI batch job belongs to."""
+    with batch_jobs_lock:
+        batch_jobs[job_id] = job
+    if redis_client:
+        try:
+            redis_client.setex(f"paa-job:{job_id}", BATCH_JOB_TTL, json.dumps(job))
+        except Exception as e:
+            print(f"Redis write failed: {e}")
+
+
+def _load_batch_job(job_id):
+    """Look up a batch job saved by this or another worker. Returns None if unknown."""
+    with batch_jobs_lock:
+        job = batch_jobs.get(job_id)
+    if job is None and redis_client:
+        try:
+            blob = redis_client.get(f"paa-job:{job_id}")
+            if blob:
+                job = json.loads(blob)
+        except Exception as e:
+            print(f"Redis read failed: {e}")
+    return job
+
+
+def submit_answer_batch(keyword, results):
+    """
+    Submit answer generation for the relevant results to the OpenAI Batch API.
+    Batch requests cost half as much as regular requests and don't count
+    against the rate limits, but complete within 24 hours instead of seconds.
+    Returns the batch job ID.
+    """
+    lines = []
+    for index, result in enumerate(results):
+        if not result.relevant:
+            continue
+        lines.append(json.dumps({
+            "custom_id": str(index),
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": _answer_request(result.question)
+        }))
+    payload = "\n".join(lines).encode()
+
+    client = get_openai_client()
+    batch_file = run_async(client.files.create(
+        file=(f"paa_{keyword.replace(' ', '_')}.jsonl", payload, "application/jsonl"),
+        purpose="batch"
+    ))
+    batch = run_async(client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h"
+    ))
+
+    _save_batch_job(batch.id, {"keyword": keyword, "questions": [asdict(result) for result in results]})
+    return batch.id
+
+
+def collect_answer_batch(job_id, job):
+    """
+    Fetch the output of a completed batch job.
+    Returns PAAItems with generated_answer filled in. The answers are also
+    stored in the answer cache, so later searches reuse them.
+    """
+    client = get_openai_client()
+    batch = run_async(client.batches.retrieve(job_id))
+    if batch.status != "completed":
+        return batch.status, None
+
+    answers = {}
+    if batch.output_file_id:
+        output = run_async(client.files.content(batch.output_file_id))
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            row = json.loads(line)
+            response = row.get("response") or {}
+            if response.get("status_code") == 200:
+                content = response["body"]["choices"][0]["message"]["content"]
+                answers[row["custom_id"]] = _limit_words(content.strip())
+
+    results = []
+    for index, item in enumerate(job["questions"]):
+        result = PAAItem(**item)
+        result.generated_answer = answers.get(str(index))
+        if result.generated_answer:
+            _store_answer(_answer_cache_key(result.question, None), result.generated_answer)
+        results.append(result)
+
+    return batch.status, results
+
+
+class _Echo:
+    """File-like object that hands written CSV lines straight back to the caller."""
+
+    def write(self, value):
+        return value
+
+
 @app.route("/download-csv", methods=["POST"])
 def download_csv():
     """Generate and download CSV file with the scraped results."""
@@ -835,35 +1858,35 @@ def download_csv():
         return jsonify({"error": "SERPAPI_KEY not configured"}), 500
 
     try:
-        results = scrape_people_also_ask(keyword)
+        results = get_people_also_ask(keyword)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
     if not results:
         return jsonify({"error": "Geen resultaten gevonden"}), 404
 
-    # Create CSV in memory
-    output = io.StringIO()
-
     # Check if any result has generated_answer
-    has_generated = any(r.get("generated_answer") for r in results)
+    has_generated = any(r.generated_answer for r in results)
 
     if has_generated:
-        fieldnames = ["question", "generated_answer", "answer", "source_title", "source_url"]
+        fieldnames = ("question", "generated_answer", "answer", "source_title", "source_url")
     else:
-        fieldnames = ["question", "answer", "source_title", "source_url"]
+        fieldnames = ("question", "answer", "source_title", "source_url")
 
-    writer = csv.DictWriter(output, fieldnames=fieldnames, extrasaction='ignore')
-    writer.writeheader()
-    writer.writerows(results)
+    # Stream the CSV row by row instead of building it in memory
+    writer = csv.writer(_Echo())
+    get_row = attrgetter(*fieldnames)
 
-    # Create response with CSV file
-    csv_content = output.getvalue()
-    output.close()
+    def generate():
+        # UTF-8 BOM so Excel opens accented characters correctly
+        yield "\ufeff"
+        yield writer.writerow(fieldnames)
+        for result in results:
+            yield writer.writerow(get_row(result))
 
     return Response(
-        csv_content,
-        mimetype="text/csv",
+        generate(),
+        content_type="text/csv; charset=utf-8",
         headers={
             "Content-Disposition": f"attachment; filename=paa_{keyword.replace(' ', '_')}.csv"
         }
@@ -872,7 +1895,78 @@ def download_csv():
 
 @app.route("/api/scrape", methods=["POST"])
 def api_scrape():
-    """API endpoint for programmatic access."""
+    """
+    API endpoint for programmatic access.
+    Expects JSON with: keyword, optionally hl and gl (default "nl").
+    Add ?forceRescrape=1 to bypass the caches.
+    """
+    data = request.get_json()
+    keyword = data.get("keyword", "").strip() if data else ""
+
+    if not keyword:
+        return jsonify({"error": "Keyword is required"}), 400
+
+    if not SERPAPI_KEY:
+        return jsonify({"error": "SERPAPI_KEY not configured"}), 500
+
+    try:
+        results = get_people_also_ask(
+            keyword,
+            hl=data.get("hl") or "nl",
+            gl=data.get("gl") or "nl",
+            refresh=request.args.get("forceRescrape") == "1"
+        )
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+    return jsonify({
+        "keyword": keyword,
+        "results": results,
+        "count": len(results)
+    })
+
+
+def _scrape_keyword(keyword):
+    """PAA lookup for one keyword of a multi-keyword request; errors are reported per keyword."""
+    try:
+        results = get_people_also_ask(keyword)
+    except Exception as e:
+        return {"keyword": keyword, "error": str(e)}
+    return {"keyword": keyword, "results": results, "count": len(results)}
+
+
+@app.route("/api/scrape-many", methods=["POST"])
+def api_scrape_many():
+    """
+    API endpoint for several keywords at once.
+    Expects JSON with: keywords (array). The keywords are scraped concurrently
+    and returned in the order they were given.
+    """
+    data = request.get_json()
+    keywords = data.get("keywords", []) if data else []
+    keywords = [keyword.strip() for keyword in keywords if isinstance(keyword, str) and keyword.strip()]
+
+    if not keywords:
+        return jsonify({"error": "Keywords are required"}), 400
+
+    if len(keywords) > MAX_KEYWORDS_PER_REQUEST:
+        return jsonify({"error": f"At most {MAX_KEYWORDS_PER_REQUEST} keywords per request"}), 400
+
+    if not SERPAPI_KEY:
+        return jsonify({"error": "SERPAPI_KEY not configured"}), 500
+
+    return jsonify({
+        "results": list(keyword_executor.map(_scrape_keyword, keywords)),
+        "count": len(keywords)
+    })
+
+
+@app.route("/api/scrape-batch", methods=["POST"])
+def api_scrape_batch():
+    """
+    Scrape PAA questions and generate their answers through the OpenAI
+    Batch API. Returns a job ID to poll at /api/job/<job_id>.
+    """
     data = request.get_json()
     keyword = data.get("keyword", "").strip() if data else ""
 
@@ -882,31 +1976,84 @@ def api_scrape():
     if not SERPAPI_KEY:
         return jsonify({"error": "SERPAPI_KEY not configured"}), 500
 
+    if not OPENAI_API_KEY:
+        return jsonify({"error": "OPENAI_API_KEY not configured"}), 500
+
     try:
-        results = scrape_people_also_ask(keyword)
+        results = get_people_also_ask(keyword)
+        if not results:
+            return jsonify({"error": "Geen resultaten gevonden"}), 404
+        if not any(result.relevant for result in results):
+            # Nothing to generate, so there is no batch to wait for
+            return jsonify({
+                "keyword": keyword,
+                "status": "completed",
+                "results": results,
+                "count": len(results)
+            })
+        job_id = submit_answer_batch(keyword, results)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
     return jsonify({
+        "job_id": job_id,
         "keyword": keyword,
+        "count": len(results),
+        "status": "submitted"
+    }), 202
+
+
+@app.route("/api/job/<job_id>")
+def api_job(job_id):
+    """Status of a batch job; includes the results once the batch has completed."""
+    job = _load_batch_job(job_id)
+    if not job:
+        return jsonify({"error": "Unknown job"}), 404
+
+    if not OPENAI_API_KEY:
+        return jsonify({"error": "OPENAI_API_KEY not configured"}), 500
+
+    try:
+        status, results = collect_answer_batch(job_id, job)
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+    if results is None:
+        return jsonify({"job_id": job_id, "keyword": job["keyword"], "status": status})
+
+    return jsonify({
+        "job_id": job_id,
+        "keyword": job["keyword"],
+        "status": status,
         "results": results,
         "count": len(results)
     })
 
 
+# Static part of the /health body, encoded once at startup (without the closing
+# brace); only the small throttle stats dict is serialized per probe.
+HEALTH_BODY_PREFIX = json.dumps(
+    {"status": "ok", "serpapi_configured": bool(SERPAPI_KEY)}, separators=(",", ":")
+)[:-1]
+
+
 @app.route("/health")
 def health():
     """Health check endpoint."""
-    return jsonify({
-        "status": "ok",
-        "serpapi_configured": bool(SERPAPI_KEY)
-    })
+    throttle = json.dumps(serpapi_throttle.stats(), separators=(",", ":"))
+    return Response(f'{HEALTH_BODY_PREFIX},"serpapi_throttle":{throttle}}}', mimetype="application/json")
 
 
 @app.route("/debug")
 def debug():
-    """Debug endpoint to see raw SerpAPI response."""
+    """
+    Debug endpoint to see raw SerpAPI response.
+    Returns a preview of the first 3 questions; pass ?full=1 for everything.
+    Responses come from the SerpAPI cache; pass ?no_cache=1 for a fresh search.
+    """
     keyword = request.args.get("q", "hypotheek")
+    full = request.args.get("full") == "1"
+    no_cache = request.args.get("no_cache") == "1"
 
     if not SERPAPI_KEY:
         return jsonify({"error": "SERPAPI_KEY not configured"})
@@ -921,18 +2068,30 @@ def debug():
             "api_key": SERPAPI_KEY
         }
 
-        search = GoogleSearch(params)
-        data = search.get_dict()
+        # Also bypass SerpAPI's own cache when a fresh result is requested
+        if no_cache:
+            params["no_cache"] = "true"
+
+        data = _serpapi_get(params, use_cache=not no_cache)
+
+        related_questions = data.get("related_questions", [])
+        people_also_ask = data.get("people_also_ask", [])
+
+        # Only preview the first few items unless ?full=1 is passed
+        if not full:
+            related_questions = related_questions[:3]
+            people_also_ask = people_also_ask[:3]
 
         # Return relevant parts of the response
         return jsonify({
             "keyword": keyword,
+            "full": full,
             "has_related_questions": "related_questions" in data,
             "has_people_also_ask": "people_also_ask" in data,
             "related_questions_count": len(data.get("related_questions", [])),
             "people_also_ask_count": len(data.get("people_also_ask", [])),
-            "related_questions": data.get("related_questions", []),
-            "people_also_ask": data.get("people_also_ask", []),
+            "related_questions": related_questions,
+            "people_also_ask": people_also_ask,
             "available_keys": list(data.keys()),
             "error": data.get("error")
         })
@@ -1050,5 +2209,5 @@ def api_wp_status():
 
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 5000))
-    app.run(host="0.0.0.0", port=port, debug=False)
+    app.run(host="0.0.0.0", port=port, debug=False, threaded=True)
 
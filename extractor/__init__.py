@@ -1,5 +1,5 @@
 """Product ranking extractor module."""
-from extractor.extractor import extract_products
-from extractor.fetcher import fetch_and_clean
+from extractor.extractor import extract_products, extract_products_many
+from extractor.fetcher import fetch_and_clean, fetch_and_clean_bytes
 
-__all__ = ["extract_products", "fetch_and_clean"]
+__all__ = ["extract_products", "extract_products_many", "fetch_and_clean", "fetch_and_clean_bytes"]
@@ -1,9 +1,38 @@
-import json
+import asyncio
+import hashlib
 import os
+import httpx
 from anthropic import AsyncAnthropic
+from lxml import etree, html as lxml_html
+
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
 
 _client: AsyncAnthropic | None = None
 
+# Extraction results keyed by a hash of URL + cleaned HTML, so unchanged pages
+# don't go to the model again. Needs diskcache; set EXTRACTOR_CACHE_DIR="" to disable.
+CACHE_DIR = os.environ.get("EXTRACTOR_CACHE_DIR", "/tmp/paa_llm")
+CACHE_TTL = 7 * 86400
+_cache = None
+_cache_failed = False
+
+# span.rating, matched on the class token like the CSS selector would
+_RATING_XPATH = etree.XPath('//span[contains(concat(" ", normalize-space(@class), " "), " rating ")]')
+
 SYSTEM_PROMPT = """\
 You are a deterministic HTML extraction engine.
 
@@ -162,36 +191,142 @@ OUTPUT FORMAT
 """
 
 
+def _get_cache():
+    # An unusable cache directory disables caching instead of failing extractions
+    global _cache, _cache_failed
+    if _cache is None and not _cache_failed and diskcache is not None and CACHE_DIR:
+        try:
+            _cache = diskcache.Cache(CACHE_DIR)
+        except Exception as e:
+            _cache_failed = True
+            print(f"Failed to open extractor cache: {e}")
+    return _cache
+
+
+def _cache_key(html: str, url: str) -> str:
+    return hashlib.blake2b(f"{url}\x00{html}".encode(), digest_size=16).hexdigest()
+
+
+def _product_fragment(html: str) -> str:
+    """Reduce cleaned HTML to the first H1 plus the product containers.
+
+    A product container is the largest element around a span.rating that
+    holds no other span.rating, which is what the system prompt treats as
+    the product section. Returns the HTML unchanged if there are no ratings
+    or if any container lacks the product's h2 and its p/ul content (e.g. on
+    flat pages where all ratings share one parent).
+    """
+    try:
+        root = lxml_html.fromstring(html)
+    except (etree.ParserError, ValueError):
+        return html
+    ratings = _RATING_XPATH(root)
+    if not ratings:
+        return html
+
+    # Number of ratings under each element, counted once per rating ancestor
+    rating_counts = {}
+    for rating in ratings:
+        for parent in rating.iterancestors():
+            rating_counts[parent] = rating_counts.get(parent, 0) + 1
+
+    containers = []
+    for rating in ratings:
+        container = rating
+        parent = container.getparent()
+        while parent is not None and rating_counts[parent] == 1:
+            container = parent
+            parent = container.getparent()
+        if container.find(".//h2") is None or (container.find(".//p") is None and container.find(".//ul") is None):
+            return html
+        containers.append(container)
+
+    parts = [_to_html(container) for container in containers]
+    h1 = root if root.tag == "h1" else root.find(".//h1")
+    container_set = set(containers)
+    if h1 is not None and not any(parent in container_set for parent in h1.iterancestors()):
+        parts.insert(0, _to_html(h1))
+    return "\n".join(parts)
+
+
+def _to_html(element) -> str:
+    return etree.tostring(element, encoding="unicode", method="html", with_tail=False)
+
+
 def _get_client() -> AsyncAnthropic:
+    # No await between the check and the assignment, so concurrent callers on
+    # the event loop can't create two clients.
     global _client
     if _client is None:
-        _client = AsyncAnthropic(api_key=os.environ["ANTHROPIC_API_KEY"])
+        # One pooled (HTTP/2 when available) connection set for all extractions
+        _client = AsyncAnthropic(
+            api_key=os.environ["ANTHROPIC_API_KEY"],
+            http_client=httpx.AsyncClient(
+                http2=_HTTP2,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+                timeout=httpx.Timeout(120.0, connect=10.0),
+            ),
+        )
     return _client
 
 
-async def extract_products(html: str, url: str) -> dict:
-    """Send cleaned HTML to Claude and return structured product data."""
+async def extract_products(html: str, url: str, force_refresh: bool = False) -> dict:
+    """Send cleaned HTML to Claude and return structured product data.
+
+    Results are cached by URL and HTML content; pass force_refresh=True to
+    skip the cached result.
+    """
+    cache = _get_cache()
+    key = _cache_key(html, url)
+    if cache is not None and not force_refresh:
+        try:
+            cached = await asyncio.to_thread(cache.get, key)
+        except Exception as e:
+            print(f"Extractor cache read failed: {e}")
+            cached = None
+        if cached is not None:
+            return cached
+
     client = _get_client()
+    # Parsing is CPU-bound; keep it off the event loop
+    fragment = await asyncio.to_thread(_product_fragment, html)
 
-    message = await client.messages.create(
+    # Stream the response so long extractions don't sit on one idle socket
+    async with client.messages.stream(
         model="claude-sonnet-4-5-20250929",
         max_tokens=4096,
         system=SYSTEM_PROMPT,
         messages=[
             {
                 "role": "user",
-                "content": f"URL: {url}\n\nHTML:\n{html}",
+                "content": f"URL: {url}\n\nHTML:\n{fragment}",
             }
         ],
-    )
-
-    raw = message.content[0].text.strip()
+    ) as stream:
+        raw = (await stream.get_final_text()).strip()
 
-    # Strip markdown fences if present
+    # Strip markdown fences if present (drops the ```json line)
     if raw.startswith("```"):
-        raw = raw.split("\n", 1)[1]
-        if raw.endswith("```"):
-            raw = raw[:-3]
-        raw = raw.strip()
+        raw = raw.partition("\n")[2].removesuffix("```").strip()
+
+    data = _json_loads(raw)
+    if cache is not None:
+        try:
+            await asyncio.to_thread(cache.set, key, data, expire=CACHE_TTL)
+        except Exception as e:
+            print(f"Extractor cache write failed: {e}")
+    return data
+
+
+async def extract_products_many(pages: list[tuple[str, str]], concurrency: int = 8) -> list[dict]:
+    """Run extract_products for (html, url) pairs concurrently, at most `concurrency` at a time.
+
+    Results are returned in input order.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _bounded(html: str, url: str) -> dict:
+        async with semaphore:
+            return await extract_products(html, url)
 
-    return json.loads(raw)
+    return await asyncio.gather(*(_bounded(html, url) for html, url in pages))
@@ -1,5 +1,16 @@
+import asyncio
+import html
+import re
+from collections import OrderedDict
+
 import httpx
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Comment, FeatureNotFound, Tag
+
+try:
+    import brotli  # noqa: F401  (lets httpx decode "br" responses)
+    _ACCEPT_ENCODING = "br, gzip, deflate"
+except ImportError:
+    _ACCEPT_ENCODING = "gzip, deflate"
 
 _HEADERS = {
     "User-Agent": (
@@ -9,47 +20,261 @@ _HEADERS = {
     ),
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
     "Accept-Language": "nl-NL,nl;q=0.9,en;q=0.8",
+    "Accept-Encoding": _ACCEPT_ENCODING,
 }
 
-STRIP_TAGS = [
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+try:
+    from lxml import etree, html as lxml_html
+    try:
+        from lxml_html_clean import Cleaner
+    except ImportError:
+        from lxml.html.clean import Cleaner  # lxml < 5.2
+except ImportError:
+    lxml_html = None
+
+_client: httpx.AsyncClient | None = None
+
+# Caps concurrent fetches to the connection pool size, so bursts wait here
+# instead of piling up inside httpx
+_semaphore = asyncio.BoundedSemaphore(100)
+
+# URL -> (etag, last_modified, cleaned_html, title) for conditional GETs;
+# the least recently used entry is dropped once the cache is full
+_CACHE_SIZE = 256
+_cache: OrderedDict[str, tuple[str | None, str | None, bytes, str]] = OrderedDict()
+
+# URL -> task for fetches in progress, so concurrent requests for the same
+# page share one download and parse
+_inflight: dict[str, asyncio.Task] = {}
+
+# Larger pages are rejected while streaming, so one huge response can't
+# exhaust the worker's memory
+MAX_BODY_BYTES = 10 * 1024 * 1024
+
+STRIP_TAGS = frozenset({
     "script", "style", "noscript", "iframe", "svg",
     "nav", "footer", "header", "aside",
     "form", "input", "button", "select", "textarea",
-]
+})
 
+# Pages without either pattern in the raw bytes can't have hidden elements,
+# so the hidden-element check is skipped for them
+_HIDDEN_HINT_RE = re.compile(rb"hidden|display *: *none", re.IGNORECASE)
 
-async def fetch_and_clean(url: str, timeout: float = 30.0) -> tuple[str, str]:
-    """Fetch a URL and return (cleaned_html, page_title)."""
-    async with httpx.AsyncClient(
-        follow_redirects=True,
-        timeout=timeout,
-        headers=_HEADERS,
-    ) as client:
-        resp = await client.get(url)
-        resp.raise_for_status()
-
-    soup = BeautifulSoup(resp.text, "html.parser")
-
-    title = soup.title.string.strip() if soup.title and soup.title.string else ""
-
-    # Remove non-content elements
-    for tag_name in STRIP_TAGS:
-        for tag in soup.find_all(tag_name):
-            tag.decompose()
-
-    # Remove comments
-    from bs4 import Comment
-    for comment in soup.find_all(string=lambda t: isinstance(t, Comment)):
-        comment.extract()
-
-    # Remove hidden elements
-    for tag in soup.find_all(attrs={"style": lambda v: v and "display:none" in v.replace(" ", "")}):
-        tag.decompose()
-    for tag in soup.find_all(attrs={"hidden": True}):
-        tag.decompose()
+# Comments are matched too (unterminated ones run to the end) so a commented-out
+# <title> is skipped rather than returned
+_TITLE_RE = re.compile(rb"<!--(?:.*?-->|.*)|<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+_HEAD_END_RE = re.compile(rb"</head", re.IGNORECASE)
+
+if lxml_html is not None:
+    # Only drops comments and STRIP_TAGS (with their contents); every other
+    # Cleaner default is off so attributes like class/style survive as before
+    _CLEANER = Cleaner(
+        scripts=False, javascript=False, comments=True, style=False,
+        links=False, meta=False, page_structure=False,
+        processing_instructions=False, embedded=False, frames=False,
+        forms=False, annoying_tags=False, remove_unknown_tags=False,
+        safe_attrs_only=False, kill_tags=STRIP_TAGS,
+    )
+    _HIDDEN_XPATH = etree.XPath('.//*[@hidden or contains(translate(@style, " ", ""), "display:none")]')
+
+
+def get_client() -> httpx.AsyncClient:
+    """Shared client, so repeat fetches reuse pooled (HTTP/2 when available) connections."""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            follow_redirects=True,
+            headers=_HEADERS,
+            http2=_HTTP2,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            timeout=httpx.Timeout(30.0),
+        )
+    return _client
+
+
+async def aclose() -> None:
+    """Close the shared client, e.g. on shutdown."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def set_concurrency(limit: int) -> None:
+    """Change how many fetches may run at once."""
+    global _semaphore
+    _semaphore = asyncio.BoundedSemaphore(limit)
+
+
+def _fast_title(body: bytes) -> str | None:
+    """Title from the <head> in the first 64 KB of raw HTML.
+
+    Returns None if it isn't there or isn't UTF-8, so the parsed title is used.
+    """
+    head_end = _HEAD_END_RE.search(body, 0, 65536)
+    if head_end is None:
+        return None
+    for match in _TITLE_RE.finditer(body, 0, head_end.start()):
+        if match.group(1) is None:
+            continue  # comment
+        try:
+            return html.unescape(match.group(1).decode("utf-8")).strip()
+        except UnicodeDecodeError:
+            return None
+    return None
+
+
+def _clean_html(body: bytes) -> tuple[bytes, str]:
+    """Strip non-content and hidden elements from a page; returns (cleaned_html, page_title).
+
+    The cleaned HTML is UTF-8 encoded.
+    """
+    if lxml_html is None:
+        return _clean_html_bs4(body)
+
+    try:
+        root = lxml_html.document_fromstring(body)
+    except etree.ParserError:
+        return b"", ""  # empty document
+
+    title = _fast_title(body)
+    if title is None:
+        title_el = root.find(".//title")
+        title = (title_el.text or "").strip() if title_el is not None else ""
+
+    # Hidden elements are matched by libxml2 in one XPath pass; drop_tree
+    # keeps the text that follows each removed element
+    if _HIDDEN_HINT_RE.search(body):
+        for element in _HIDDEN_XPATH(root):
+            if element.getparent() is not None:
+                element.drop_tree()
+    _CLEANER(root)
+
+    # Get the main content area if it exists, otherwise use body
+    main = root.find(".//main")
+    if main is None:
+        main = root.find(".//article")
+    if main is None:
+        main = root.find(".//body")
+    if main is None:
+        main = root
+    cleaned = etree.tostring(main, encoding="utf-8", method="html", with_tail=False)
+
+    return cleaned, title
+
+
+def _clean_html_bs4(body: bytes) -> tuple[bytes, str]:
+    """BeautifulSoup version of _clean_html, used when lxml isn't installed."""
+    # Raw bytes let lxml detect the encoding itself; html.parser if lxml is missing
+    try:
+        soup = BeautifulSoup(body, "lxml")
+    except FeatureNotFound:
+        soup = BeautifulSoup(body, "html.parser")
+
+    title = _fast_title(body)
+    if title is None:
+        title = soup.title.string.strip() if soup.title and soup.title.string else ""
+
+    # Remove non-content elements, comments and hidden elements in one pass
+    check_hidden = _HIDDEN_HINT_RE.search(body) is not None
+    for element in list(soup.descendants):
+        if element.decomposed:
+            continue  # inside a subtree that was already removed
+        if isinstance(element, Comment):
+            element.extract()
+        elif isinstance(element, Tag) and (
+            element.name in STRIP_TAGS
+            or check_hidden and (
+                element.has_attr("hidden")
+                or "display:none" in element.get("style", "").replace(" ", "")
+            )
+        ):
+            element.decompose()
 
     # Get the main content area if it exists, otherwise use body
     main = soup.find("main") or soup.find("article") or soup.find("body") or soup
-    cleaned = str(main)
+    cleaned = main.encode("utf-8")
+
+    return cleaned, title
+
+
+async def _read_body(resp: httpx.Response, url: str) -> bytes:
+    """Read a streamed response body, raising ValueError past MAX_BODY_BYTES."""
+    chunks = []
+    total = 0
+    async for chunk in resp.aiter_bytes(65536):
+        total += len(chunk)
+        if total > MAX_BODY_BYTES:
+            raise ValueError(f"Response from {url} is larger than {MAX_BODY_BYTES} bytes")
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+async def fetch_and_clean(url: str, timeout: float = 30.0) -> tuple[str, str]:
+    """Fetch a URL and return (cleaned_html, page_title).
+
+    Same as fetch_and_clean_bytes, with the HTML decoded to str.
+    """
+    cleaned, title = await fetch_and_clean_bytes(url, timeout)
+    return cleaned.decode("utf-8"), title
+
+
+async def fetch_and_clean_bytes(url: str, timeout: float = 30.0) -> tuple[bytes, str]:
+    """Fetch a URL and return (cleaned_html, page_title), with the HTML as UTF-8 bytes.
+
+    Concurrent calls for the same URL share a single fetch. Pages fetched
+    before are revalidated with If-None-Match/If-Modified-Since; on 304 the
+    cached result is returned without downloading or parsing.
+    Non-HTML responses return empty HTML and title without being downloaded.
+    Raises ValueError for bodies larger than MAX_BODY_BYTES.
+    """
+    task = _inflight.get(url)
+    if task is None:
+        task = asyncio.ensure_future(_fetch_and_clean(url, timeout))
+        _inflight[url] = task
+        task.add_done_callback(lambda _: _inflight.pop(url, None))
+    # Shielded so one cancelled caller doesn't cancel the fetch for the others
+    return await asyncio.shield(task)
+
+
+async def _fetch_and_clean(url: str, timeout: float) -> tuple[bytes, str]:
+    cached = _cache.get(url)
+    headers = {}
+    if cached:
+        etag, last_modified = cached[0], cached[1]
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+    async with _semaphore:
+        async with get_client().stream("GET", url, headers=headers, timeout=timeout) as resp:
+            if resp.status_code == 304 and cached:
+                _cache.move_to_end(url)
+                return cached[2], cached[3]
+            resp.raise_for_status()
+            # PDFs, images etc. aren't worth downloading or parsing
+            content_type = resp.headers.get("Content-Type", "").lower()
+            if content_type and "html" not in content_type and "xml" not in content_type:
+                return b"", ""
+            body = await _read_body(resp, url)
+
+    # Parsing is CPU-bound; run it in a thread so other fetches keep going
+    cleaned, title = await asyncio.to_thread(_clean_html, body)
+
+    etag = resp.headers.get("ETag")
+    last_modified = resp.headers.get("Last-Modified")
+    if etag or last_modified:
+        _cache[url] = (etag, last_modified, cleaned, title)
+        _cache.move_to_end(url)
+        if len(_cache) > _CACHE_SIZE:
+            _cache.popitem(last=False)
 
     return cleaned, title
@@ -0,0 +1,23 @@
+import os
+import sys
+
+# gunicorn doesn't put the app directory on sys.path before loading this file
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from worker_mode import USE_GEVENT  # noqa: E402
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+timeout = 120
+workers = int(os.environ.get("GUNICORN_WORKERS", 2))
+
+# Most requests wait on SerpAPI/OpenAI, so with USE_GEVENT=1 each worker
+# serves many requests concurrently instead of one at a time. The background
+# asyncio loop in app.py then runs as a greenlet (see the note there), and
+# asyncio.to_thread work no longer runs in parallel.
+if USE_GEVENT:
+    worker_class = "gevent"
+    worker_connections = int(os.environ.get("GUNICORN_WORKER_CONNECTIONS", 1000))
+else:
+    # Threads release the GIL while waiting on sockets, which is all these
+    # requests do, so a thread pool per worker overlaps them just as well.
+    worker_class = "gthread"
+    threads = int(os.environ.get("GUNICORN_THREADS", 16))
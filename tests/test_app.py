@@ -0,0 +1,58 @@
+import unittest
+from unittest import mock
+
+import requests
+
+import app
+
+
+class ParsePageFieldsTest(unittest.TestCase):
+    BODY = (
+        "<html><head><title>Beste koffiemachine – café</title></head>"
+        "<body><h1>Café crème</h1></body></html>"
+    ).encode("utf-8")
+
+    def test_header_charset_used_without_meta_charset(self):
+        response = requests.Response()
+        response.headers["Content-Type"] = "text/html; charset=utf-8"
+
+        fields = app._parse_page_fields(self.BODY, app._response_charset(response))
+
+        self.assertEqual(fields, ("Café crème", "Beste koffiemachine – café", ""))
+
+    def test_no_charset_in_header(self):
+        response = requests.Response()
+        response.headers["Content-Type"] = "text/html"
+
+        self.assertIsNone(app._response_charset(response))
+
+    def test_blank_body(self):
+        self.assertEqual(app._parse_page_fields(b"  \n"), ("", "", ""))
+
+
+class ApiScrapeTest(unittest.TestCase):
+    def test_result_keys_are_sorted(self):
+        item = app.PAAItem(
+            question="Wat is de beste koffiemachine?",
+            answer="Een volautomaat.",
+            generated_answer=None,
+            source_title="Koffiemachines",
+            source_url="https://example.com",
+            relevant=True,
+        )
+        client = app.app.test_client()
+        with mock.patch.object(app, "SERPAPI_KEY", "test"), \
+                mock.patch.object(app, "get_people_also_ask", return_value=[item]):
+            response = client.post("/api/scrape", json={"keyword": "koffiemachine"})
+
+        self.assertEqual(response.status_code, 200)
+        body = response.get_data(as_text=True)
+        self.assertTrue(body.startswith('{"count":1,"keyword":"koffiemachine","results":[{"answer":'))
+        self.assertEqual(
+            list(response.get_json()["results"][0]),
+            ["answer", "generated_answer", "question", "relevant", "source_title", "source_url"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,5 @@
+"""Worker settings shared by gunicorn.conf.py and app.py."""
+import os
+
+# Only explicit truthy values enable gevent, so USE_GEVENT=0/false doesn't
+USE_GEVENT = os.environ.get("USE_GEVENT", "").strip().lower() in {"1", "true", "yes"}